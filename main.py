@@ -1,15 +1,23 @@
-from fastapi import FastAPI, HTTPException, Depends, WebSocket, WebSocketDisconnect
+from fastapi import FastAPI, HTTPException, Depends, WebSocket, WebSocketDisconnect, Request, Query
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
-from pydantic import BaseModel, EmailStr
+from fastapi.concurrency import run_in_threadpool
+from pydantic import BaseModel, EmailStr, ValidationError
 from typing import List, Optional, Dict, Any
 import json
 import asyncio
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 import os
 from supabase import create_client, Client
+from postgrest.exceptions import APIError
 from dotenv import load_dotenv
 import requests
+import re
+import csv
+import codecs
+import heapq
+from bisect import bisect_left, insort
+from itertools import islice
 
 # Load environment variables
 load_dotenv()
@@ -76,6 +84,22 @@ class AuctionResponse(BaseModel):
     bid_count: int
     created_at: datetime
 
+class ImportRowError(BaseModel):
+    row: int
+    error: str
+
+class ImportBatchError(BaseModel):
+    first_row: int
+    last_row: int
+    rows: int
+    error: str
+
+class AuctionImportResponse(BaseModel):
+    imported: int
+    failed: int
+    errors: List[ImportRowError]
+    batch_errors: List[ImportBatchError]
+
 class BidResponse(BaseModel):
     id: int
     auction_id: int
@@ -112,6 +136,322 @@ class ConnectionManager:
 
 manager = ConnectionManager()
 
+# In-memory search index over active auctions
+SEARCH_STOPWORDS = {"a", "an", "and", "at", "for", "in", "of", "on", "the", "to", "with"}
+
+def tokenize(text: str) -> List[str]:
+    """Split text into lowercase search tokens, dropping stopwords"""
+    return [t for t in re.findall(r"[a-z0-9]+", (text or "").lower()) if t not in SEARCH_STOPWORDS]
+
+def within_edit_distance(a: str, b: str, max_edits: int) -> bool:
+    """Bounded Levenshtein check that bails out as soon as a row exceeds max_edits"""
+    if abs(len(a) - len(b)) > max_edits:
+        return False
+    previous = list(range(len(b) + 1))
+    for i, ca in enumerate(a, 1):
+        current = [i]
+        for j, cb in enumerate(b, 1):
+            current.append(min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + (ca != cb)))
+        if min(current) > max_edits:
+            return False
+        previous = current
+    return previous[-1] <= max_edits
+
+def deletion_variants(token: str, max_edits: int) -> set:
+    """All strings reachable from token by deleting up to max_edits characters"""
+    variants = {token}
+    frontier = {token}
+    for _ in range(max_edits):
+        frontier = {word[:i] + word[i + 1:] for word in frontier for i in range(len(word))}
+        variants |= frontier
+    return variants
+
+class AuctionSearchIndex:
+    """Inverted index over title and description of active auctions.
+
+    Maintained incrementally as auctions are created, updated, bid on and ended,
+    so lookups never hit the database.
+    """
+    TITLE_WEIGHT = 2.0
+    DESCRIPTION_WEIGHT = 1.0
+    FUZZY_MAX_EDITS = 2
+    RESOLVE_MARGIN = 1.5  # best hit must outscore the runner-up by this factor
+
+    def __init__(self):
+        self.auctions: Dict[int, Dict[str, Any]] = {}
+        self.postings: Dict[str, Dict[int, float]] = {}
+        self.auction_tokens: Dict[int, set] = {}
+        self.vocabulary: List[str] = []  # sorted, for prefix lookups
+        # Deletion neighbourhood (SymSpell-style): variant -> vocabulary tokens producing it.
+        # Two strings within N edits share a variant reachable by <= N deletions from each.
+        self.deletions: Dict[str, set] = {}
+
+    def rebuild(self, auctions: List[Dict[str, Any]]):
+        self.__init__()
+        for auction in auctions:
+            self.upsert(auction)
+
+    def upsert(self, auction: Dict[str, Any]):
+        """Add an auction or refresh its indexed fields"""
+        auction_id = auction['id']
+        if auction.get('status', 'active') != 'active':
+            self.remove(auction_id)
+            return
+        previous = self.auctions.get(auction_id)
+        merged = {**(previous or {}), **auction}
+        self.auctions[auction_id] = merged
+        if previous and (previous.get('title'), previous.get('description')) == (merged.get('title'), merged.get('description')):
+            # Only bid/price fields changed, postings are still valid
+            return
+        self._unindex(auction_id)
+        weights: Dict[str, float] = {}
+        for token in tokenize(merged.get('title')):
+            weights[token] = weights.get(token, 0) + self.TITLE_WEIGHT
+        for token in tokenize(merged.get('description')):
+            weights[token] = weights.get(token, 0) + self.DESCRIPTION_WEIGHT
+        for token, weight in weights.items():
+            if token not in self.postings:
+                self.postings[token] = {}
+                insort(self.vocabulary, token)
+                for variant in deletion_variants(token, self.FUZZY_MAX_EDITS):
+                    self.deletions.setdefault(variant, set()).add(token)
+            self.postings[token][auction_id] = weight
+        self.auction_tokens[auction_id] = set(weights)
+
+    def remove(self, auction_id: int):
+        self._unindex(auction_id)
+        self.auctions.pop(auction_id, None)
+
+    def _unindex(self, auction_id: int):
+        for token in self.auction_tokens.pop(auction_id, ()):
+            posting = self.postings.get(token)
+            if posting is None:
+                continue
+            posting.pop(auction_id, None)
+            if not posting:
+                del self.postings[token]
+                del self.vocabulary[bisect_left(self.vocabulary, token)]
+                for variant in deletion_variants(token, self.FUZZY_MAX_EDITS):
+                    tokens = self.deletions[variant]
+                    tokens.discard(token)
+                    if not tokens:
+                        del self.deletions[variant]
+
+    def _expand(self, token: str, fuzzy: bool) -> Dict[str, float]:
+        """Map a query token to matching vocabulary tokens with a match-quality factor"""
+        matches: Dict[str, float] = {}
+        if token in self.postings:
+            matches[token] = 1.0
+        start = bisect_left(self.vocabulary, token)
+        for candidate in islice(self.vocabulary, start, None):
+            if not candidate.startswith(token):
+                break
+            matches.setdefault(candidate, 0.75)
+        if fuzzy and len(token) >= 3:
+            max_edits = 1 if len(token) <= 5 else self.FUZZY_MAX_EDITS
+            candidates = set()
+            for variant in deletion_variants(token, max_edits):
+                candidates |= self.deletions.get(variant, set())
+            for candidate in candidates:
+                if candidate not in matches and within_edit_distance(token, candidate, max_edits):
+                    matches[candidate] = 0.5
+        return matches
+
+    def _score(self, tokens: List[str], fuzzy: bool) -> Dict[int, List[float]]:
+        """Map auction id to [number of query tokens matched, relevance score]"""
+        scores: Dict[int, List[float]] = {}
+        for token in tokens:
+            best: Dict[int, float] = {}
+            for candidate, factor in self._expand(token, fuzzy).items():
+                for auction_id, weight in self.postings[candidate].items():
+                    best[auction_id] = max(best.get(auction_id, 0), weight * factor)
+            for auction_id, score in best.items():
+                entry = scores.setdefault(auction_id, [0, 0.0])
+                entry[0] += 1
+                entry[1] += score
+        return scores
+
+    def search(self, query: str, limit: int = 10, fuzzy: bool = True) -> List[Dict[str, Any]]:
+        """Return active auctions ranked by relevance to the query"""
+        scores = self._score(tokenize(query), fuzzy)
+        ranked = sorted(scores, key=lambda auction_id: (-scores[auction_id][1], auction_id))
+        return [self.auctions[auction_id] for auction_id in ranked[:limit]]
+
+    def resolve(self, query: str) -> Optional[int]:
+        """Resolve a spoken item name to a single auction, or None when not confident.
+
+        Only exact and prefix matches count, every query token must match, and the
+        best hit must clearly outscore the runner-up.
+        """
+        tokens = tokenize(query)
+        scores = self._score(tokens, fuzzy=False)
+        ranked = sorted(((score, auction_id) for auction_id, (matched, score) in scores.items() if matched == len(tokens)), reverse=True)
+        if not ranked or (len(ranked) > 1 and ranked[0][0] < ranked[1][0] * self.RESOLVE_MARGIN):
+            return None
+        return ranked[0][1]
+
+search_index = AuctionSearchIndex()
+
+# Outbid alerts
+# Default/system user for Omnidimension bids; its alerts are spoken rather than pushed
+VOICE_BIDDER = {
+    'id': 'omnidimension-system',
+    'email': 'omnidimension@system.local'
+}
+OUTBID_COALESCE_SECONDS = 0.5
+USER_ALERT_INTERVAL_SECONDS = 10.0  # at most one outbid alert per user in this window
+OUTBID_CLOSING_SECONDS = 60.0  # lots closing within this window use the shorter interval
+CLOSING_ALERT_INTERVAL_SECONDS = 2.0
+VOICE_ALERT_INTERVAL_SECONDS = 2.0
+
+class OutbidNotifier:
+    """Tracks the leading bidder per auction and alerts users when they are outbid.
+
+    Pending alerts are coalesced per user, keeping only the latest state of each
+    auction, until the user's next allowed delivery time. That throttle shrinks
+    for lots about to close and never pushes an alert past the close, and users
+    due at the same time are alerted in order of auction end time.
+    """
+    def __init__(self):
+        self.subscribers: Dict[str, List[WebSocket]] = {}
+        self.leaders: Dict[int, Dict[str, Any]] = {}
+        self.pending: Dict[str, Dict[int, Dict[str, Any]]] = {}  # user_id -> auction_id -> latest alert
+        self.due: Dict[str, float] = {}  # user_id -> when their pending alerts go out
+        self.last_alert: Dict[str, float] = {}  # user_id -> when they were last alerted
+        self.queue: List[tuple] = []  # heap of (due timestamp, user_id)
+        self.wakeup = asyncio.Event()
+        self.voice_alerts: Optional[List[Dict[str, Any]]] = None  # latest unspoken alerts
+        self.voice_wakeup = asyncio.Event()
+
+    async def subscribe(self, websocket: WebSocket, user_id: str):
+        await websocket.accept()
+        self.subscribers.setdefault(user_id, []).append(websocket)
+
+    def unsubscribe(self, websocket: WebSocket, user_id: str):
+        if websocket in self.subscribers.get(user_id, []):
+            self.subscribers[user_id].remove(websocket)
+            if not self.subscribers[user_id]:
+                del self.subscribers[user_id]
+
+    def leader(self, auction_id: int) -> Optional[Dict[str, Any]]:
+        return self.leaders.get(auction_id)
+
+    def record_bid(self, auction: Dict[str, Any], user_id: str, user_email: str, amount: float,
+                   previous: Optional[Dict[str, Any]] = None):
+        """Record the new leading bid and queue an alert for the leader it displaced"""
+        auction_id = auction['id']
+        previous = previous or self.leaders.get(auction_id)
+        self.leaders[auction_id] = {'user_id': user_id, 'user_email': user_email, 'amount': amount}
+        # The new leader no longer needs to hear about being outbid here
+        self._drop(user_id, auction_id)
+        if not previous or previous['user_id'] == user_id:
+            return
+        outbid_user = previous['user_id']
+        end_ts = parse_timestamp(auction['end_time'])
+        self.pending.setdefault(outbid_user, {})[auction_id] = {
+            'auction_id': auction_id,
+            'title': auction['title'],
+            'your_bid': previous['amount'],
+            'current_bid': amount,
+            'end_time': auction['end_time'],
+            'end_ts': end_ts
+        }
+        # Trailing debounce: later outbids collapse into the pending alert until it is due,
+        # but a lot about to close may pull the user's due time earlier
+        now = datetime.now().timestamp()
+        closing = end_ts - now <= OUTBID_CLOSING_SECONDS
+        interval = CLOSING_ALERT_INTERVAL_SECONDS if closing else USER_ALERT_INTERVAL_SECONDS
+        due = max(now + OUTBID_COALESCE_SECONDS,
+                  min(self.last_alert.get(outbid_user, 0.0) + interval, end_ts - OUTBID_COALESCE_SECONDS))
+        if due < self.due.get(outbid_user, float('inf')):
+            self.due[outbid_user] = due  # any later heap entry for this user is now stale
+            heapq.heappush(self.queue, (due, outbid_user))
+            self.wakeup.set()
+
+    def forget(self, auction_id: int):
+        """Drop leader and pending alerts for an auction that has ended"""
+        self.leaders.pop(auction_id, None)
+        for user_id in list(self.pending):
+            self._drop(user_id, auction_id)
+
+    def _drop(self, user_id: str, auction_id: int):
+        alerts = self.pending.get(user_id)
+        if alerts and alerts.pop(auction_id, None) and not alerts:
+            del self.pending[user_id]
+            self.due.pop(user_id, None)
+
+    async def run(self):
+        while True:
+            try:
+                self.wakeup.clear()
+                now = datetime.now().timestamp()
+                ready = []
+                # Take each due user's alerts before any await: deliveries yield, and record_bid
+                # may rebid (dropping) or re-queue the same user in the meantime
+                while self.queue and self.queue[0][0] <= now:
+                    due, user_id = heapq.heappop(self.queue)
+                    if self.due.get(user_id) != due:
+                        continue  # stale entry, the user's alerts were dropped
+                    del self.due[user_id]
+                    alerts = sorted(self.pending.pop(user_id, {}).values(), key=lambda alert: alert['end_ts'])
+                    if alerts:
+                        ready.append((alerts[0]['end_ts'], user_id, alerts))
+                # Among users due now, lots closing soonest go first
+                for _, user_id, alerts in sorted(ready, key=lambda entry: entry[:2]):
+                    try:
+                        self.last_alert[user_id] = now
+                        await self._deliver(user_id, alerts)
+                    except Exception as e:
+                        print(f"[Outbid Alerts] Error alerting user {user_id}: {e}")
+                if not self.queue:
+                    await self.wakeup.wait()
+                    continue
+                try:
+                    # Sleep until the next user is due, or until a new alert is queued
+                    await asyncio.wait_for(self.wakeup.wait(), timeout=max(0.0, self.queue[0][0] - datetime.now().timestamp()))
+                except asyncio.TimeoutError:
+                    pass
+            except Exception as e:
+                # Never let one bad pass end the worker; alerts would stop until restart
+                print(f"[Outbid Alerts] Error in alert worker: {e}")
+                await asyncio.sleep(1)
+
+    async def _deliver(self, user_id: str, alerts: List[Dict[str, Any]]):
+        message = json.dumps({
+            "type": "outbid",
+            "data": [{k: v for k, v in alert.items() if k != 'end_ts'} for alert in alerts]
+        })
+        for connection in list(self.subscribers.get(user_id, [])):
+            try:
+                await connection.send_text(message)
+            except:
+                # Remove broken connections
+                self.unsubscribe(connection, user_id)
+        if user_id == VOICE_BIDDER['id']:
+            # Handed to run_voice so its rate limit never holds up other users
+            self.voice_alerts = alerts
+            self.voice_wakeup.set()
+
+    async def run_voice(self):
+        while True:
+            await self.voice_wakeup.wait()
+            self.voice_wakeup.clear()
+            alerts, self.voice_alerts = self.voice_alerts, None
+            if not alerts:
+                continue
+            first = alerts[0]
+            text = f"You have been outbid on {first['title']}, current bid is ₹{first['current_bid']}"
+            if len(alerts) > 1:
+                text += f", and on {len(alerts) - 1} other auction{'s' if len(alerts) > 2 else ''}"
+            try:
+                await send_voice_notification(text)
+            except Exception as e:
+                print(f"[Outbid Alerts] Error sending voice alert: {e}")
+            # Space out spoken alerts so the voice gateway is not flooded
+            await asyncio.sleep(VOICE_ALERT_INTERVAL_SECONDS)
+
+outbid_notifier = OutbidNotifier()
+
 # Helper functions
 async def get_current_user(credentials: HTTPAuthorizationCredentials = Depends(security)):
     """Get current user from JWT token"""
@@ -125,6 +465,35 @@ async def get_current_user(credentials: HTTPAuthorizationCredentials = Depends(s
     except Exception as e:
         raise HTTPException(status_code=401, detail="Invalid token")
 
+def as_utc(value: datetime) -> datetime:
+    """Treat naive datetimes as UTC, matching how Postgres stores them"""
+    return value.replace(tzinfo=timezone.utc) if value.tzinfo is None else value
+
+def parse_timestamp(value) -> float:
+    """Convert a datetime or ISO string (as stored by Supabase) to a POSIX timestamp"""
+    if isinstance(value, str):
+        value = datetime.fromisoformat(value.replace('Z', '+00:00'))
+    return as_utc(value).timestamp()
+
+def build_auction_record(auction: AuctionCreate) -> Dict[str, Any]:
+    """Add default values for a new auction row"""
+    return {
+        **auction.dict(),
+        'end_time': as_utc(auction.end_time).isoformat(),
+        'status': 'active',
+        'current_bid': auction.minimum_bid,
+        'bid_count': 0,
+        'created_at': datetime.now().isoformat()
+    }
+
+def get_leading_bid(auction: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """Current leading bid for an auction, looked up in the database only after a restart"""
+    leader = outbid_notifier.leader(auction['id'])
+    if leader is None and auction.get('bid_count'):
+        top_bid = supabase.table('bids').select('*').eq('auction_id', auction['id']).order('amount', desc=True).limit(1).execute()
+        leader = top_bid.data[0] if top_bid.data else None
+    return leader
+
 # Omnidimension API helper functions
 async def send_voice_notification(message: str, room_id: str = None):
     """Send a voice notification using Omnidimension"""
@@ -145,6 +514,8 @@ async def send_voice_notification(message: str, room_id: str = None):
 @app.on_event("startup")
 async def startup_event():
     """Initialize the application"""
+    search_index.rebuild(await list_active_auctions())
+    print(f"[Search] Indexed {len(search_index.auctions)} active auctions")
     print("Auctioneer API started successfully!")
 
 @app.get("/")
@@ -228,6 +599,12 @@ async def get_auctions(status: Optional[str] = None, limit: int = 50):
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to fetch auctions: {str(e)}")
 
+@app.get("/auctions/search", response_model=List[AuctionResponse])
+async def search_auctions(q: str = Query(..., min_length=1, max_length=200),
+                          limit: int = Query(10, ge=1, le=100), fuzzy: bool = True):
+    """Search active auctions by title and description (served from memory)"""
+    return search_index.search(q, limit=limit, fuzzy=fuzzy)
+
 @app.get("/auctions/{auction_id}", response_model=AuctionResponse)
 async def get_auction(auction_id: int):
     """Get specific auction by ID"""
@@ -247,28 +624,170 @@ async def get_auction(auction_id: int):
 async def create_auction(auction: AuctionCreate, current_user = Depends(get_current_user)):
     """Create a new auction"""
     try:
-        # Add default values for new auctions
-        auction_data = {
-            **auction.dict(),
-            'status': 'active',
-            'current_bid': auction.minimum_bid,
-            'bid_count': 0,
-            'created_at': datetime.now().isoformat()
-        }
+        auction_data = build_auction_record(auction)
         
         response = supabase.table('auctions').insert(auction_data).select().execute()
         
         if response.data:
             created_auction = response.data[0]
             print(f"New auction created: {created_auction['id']}")
-            # Start the cleanup task for this auction
-            asyncio.create_task(schedule_auction_end(created_auction['id'], auction.end_time))
+            search_index.upsert(created_auction)
+            # Register the end time with the auction scheduler
+            auction_scheduler.schedule(created_auction['id'], auction.end_time)
             return created_auction
         else:
             raise HTTPException(status_code=400, detail="Failed to create auction")
     except Exception as e:
         raise HTTPException(status_code=400, detail=str(e))
 
+# Bulk import
+IMPORT_BATCH_SIZE = 500
+IMPORT_MAX_RECORD_CHARS = 64 * 1024
+
+async def iter_request_lines(request: Request):
+    """Yield lines of a streamed request body without buffering the whole body"""
+    decoder = codecs.getincrementaldecoder('utf-8-sig')()
+    pending = ''
+    async for chunk in request.stream():
+        pending += decoder.decode(chunk)
+        lines = pending.split('\n')
+        pending = lines.pop()
+        if len(pending) > IMPORT_MAX_RECORD_CHARS:
+            raise HTTPException(status_code=413, detail=f"Line longer than {IMPORT_MAX_RECORD_CHARS} characters")
+        for line in lines:
+            yield line.rstrip('\r')
+    pending += decoder.decode(b'', final=True)
+    if pending:
+        yield pending.rstrip('\r')
+
+def parse_csv_record(lines: List[str]) -> Optional[List[str]]:
+    """Parse one CSV record from its physical lines, or return None while a quoted field is still open"""
+    try:
+        return next(csv.reader(lines, strict=True), [])
+    except csv.Error as e:
+        if 'unexpected end of data' in str(e):
+            return None
+    # Otherwise well-formed enough for the default, lenient dialect (e.g. '"a"b')
+    return next(csv.reader(lines), [])
+
+async def iter_import_rows(request: Request):
+    """Yield (line number, parsed row or error message) from an NDJSON or CSV body"""
+    is_csv = 'csv' in request.headers.get('content-type', '')
+    header = None
+    record: List[str] = []  # physical lines of the CSV record being read
+    record_chars = 0
+    record_start = 0
+    line_num = 0
+    async for line in iter_request_lines(request):
+        line_num += 1
+        if not is_csv:
+            if line.strip():
+                try:
+                    parsed = json.loads(line)
+                except ValueError as e:
+                    parsed = f"Malformed row: {e}"
+                yield line_num, parsed
+            continue
+        if not record:
+            if not line.strip():
+                continue
+            record_start, record_chars = line_num, 0
+        record.append(line + '\n')
+        record_chars += len(line)
+        fields = parse_csv_record(record)
+        if fields is None:
+            if record_chars > IMPORT_MAX_RECORD_CHARS:
+                # Most likely a stray opening quote; drop the record rather than buffer the whole body
+                yield record_start, f"Malformed row: record longer than {IMPORT_MAX_RECORD_CHARS} characters"
+                record = []
+            continue  # a quoted field spans several lines
+        record = []
+        if header is None:
+            header = [name.strip() for name in fields]
+            continue
+        yield record_start, dict(zip(header, fields))
+    if record:
+        yield record_start, "Malformed row: unterminated quoted field"
+
+def validate_import_row(parsed) -> Dict[str, Any]:
+    """Turn a parsed import row into an auction record, raising ValueError if invalid"""
+    if isinstance(parsed, str):
+        raise ValueError(parsed)
+    if not isinstance(parsed, dict):
+        raise ValueError("Row must be an object")
+    try:
+        auction = AuctionCreate(**parsed)
+    except ValidationError as e:
+        raise ValueError("; ".join(f"{'.'.join(map(str, err['loc']))}: {err['msg']}" for err in e.errors()))
+    # A past end time would be ended (and deleted) by the scheduler right after insert
+    if as_utc(auction.end_time) <= datetime.now(timezone.utc):
+        raise ValueError("end_time: must be in the future")
+    return build_auction_record(auction)
+
+def is_rejected_row_data(error: Exception) -> bool:
+    """True for PostgREST data/constraint errors, where nothing was written and a retry is safe"""
+    code = str(getattr(error, 'code', '') or '')
+    return isinstance(error, APIError) and code.startswith(('22', '23', 'PGRST'))
+
+def insert_auction_batch(batch: List[tuple], errors: List[Dict[str, Any]],
+                         batch_errors: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Insert (row number, record) pairs in one request, isolating bad rows if it is rejected"""
+    try:
+        response = supabase.table('auctions').insert([record for _, record in batch]).execute()
+        return response.data or []
+    except Exception as e:
+        if not is_rejected_row_data(e):
+            # Timeouts and dropped connections may have committed the batch; retrying could duplicate it
+            print(f"[Auction Import] Batch insert of rows {batch[0][0]}-{batch[-1][0]} failed: {e}")
+            batch_errors.append({"first_row": batch[0][0], "last_row": batch[-1][0], "rows": len(batch),
+                                 "error": f"Batch insert failed, rows may or may not have been imported: {e}"})
+            return []
+        print(f"[Auction Import] Batch insert of {len(batch)} rows rejected, retrying row by row: {e}")
+    inserted = []
+    for row, record in batch:
+        try:
+            inserted.extend(supabase.table('auctions').insert(record).execute().data or [])
+        except Exception as e:
+            errors.append({"row": row, "error": str(e)})
+    return inserted
+
+@app.post("/auctions/import", response_model=AuctionImportResponse)
+async def import_auctions(request: Request, current_user = Depends(get_current_user)):
+    """Bulk import auctions from a streamed NDJSON or CSV (Content-Type: text/csv) body.
+
+    Errors are reported against the line number each row starts on.
+    """
+    errors: List[Dict[str, Any]] = []
+    batch_errors: List[Dict[str, Any]] = []
+    batch: List[tuple] = []
+    end_times: List[tuple] = []
+
+    async def flush():
+        # The Supabase client is synchronous; keep batch inserts off the event loop
+        for created_auction in await run_in_threadpool(insert_auction_batch, batch, errors, batch_errors):
+            search_index.upsert(created_auction)
+            end_times.append((created_auction['id'], created_auction['end_time']))
+        batch.clear()
+
+    try:
+        async for row, parsed in iter_import_rows(request):
+            try:
+                batch.append((row, validate_import_row(parsed)))
+            except ValueError as e:
+                errors.append({"row": row, "error": str(e)})
+            if len(batch) >= IMPORT_BATCH_SIZE:
+                await flush()
+        if batch:
+            await flush()
+    finally:
+        # Register everything that made it into the database, even if the stream broke off
+        if end_times:
+            auction_scheduler.schedule_many(end_times)
+
+    failed = len(errors) + sum(e['rows'] for e in batch_errors)
+    print(f"[Auction Import] Imported {len(end_times)} auctions, {failed} rows failed")
+    return {"imported": len(end_times), "failed": failed, "errors": errors, "batch_errors": batch_errors}
+
 @app.put("/auctions/{auction_id}", response_model=AuctionResponse)
 async def update_auction(auction_id: int, auction: AuctionUpdate, current_user = Depends(get_current_user)):
     """Update an auction"""
@@ -276,6 +795,7 @@ async def update_auction(auction_id: int, auction: AuctionUpdate, current_user =
         response = supabase.table('auctions').update(auction.dict(exclude_unset=True)).eq('id', auction_id).execute()
         
         if response.data:
+            search_index.upsert(response.data[0])
             # Broadcast update via WebSocket
             await manager.broadcast_to_auction(json.dumps({"type": "auction_update", "data": response.data[0]}), auction_id)
             return response.data[0]
@@ -296,6 +816,7 @@ async def place_bid(bid: BidCreate, current_user = Depends(get_current_user)):
             raise HTTPException(status_code=400, detail="Auction not active or not found")
         if bid.amount is None or bid.amount < auction['minimum_bid'] or bid.amount <= auction['current_bid']:
             raise HTTPException(status_code=400, detail="Bid too low")
+        previous_leader = get_leading_bid(auction)
         # Insert the bid
         supabase.table('bids').insert({
             'auction_id': bid.auction_id,
@@ -311,6 +832,8 @@ async def place_bid(bid: BidCreate, current_user = Depends(get_current_user)):
         }).eq('id', bid.auction_id).execute()
         # Broadcast the new bid to all clients
         auction_resp = supabase.table('auctions').select('*').eq('id', bid.auction_id).single().execute()
+        search_index.upsert(auction_resp.data)
+        outbid_notifier.record_bid(auction, str(current_user.id), current_user.email, bid.amount, previous=previous_leader)
         await manager.broadcast_to_auction(json.dumps({
             "type": "new_bid",
             "data": {
@@ -371,6 +894,23 @@ async def get_auction_analytics():
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
+# WebSocket endpoint for a user's outbid alerts
+@app.websocket("/ws/alerts")
+async def outbid_alerts_websocket(websocket: WebSocket, token: str):
+    try:
+        user = supabase.auth.get_user(token).user
+    except Exception:
+        user = None
+    if not user:
+        await websocket.close(code=1008)
+        return
+    await outbid_notifier.subscribe(websocket, str(user.id))
+    try:
+        while True:
+            await websocket.receive_text()
+    except WebSocketDisconnect:
+        outbid_notifier.unsubscribe(websocket, str(user.id))
+
 # WebSocket endpoint for real-time updates
 @app.websocket("/ws/{auction_id}")
 async def websocket_endpoint(websocket: WebSocket, auction_id: int):
@@ -436,6 +976,8 @@ async def end_expired_auctions():
                             .update({'status': 'ended'})\
                             .eq('id', auction_id)\
                             .execute()
+                        search_index.remove(auction_id)
+                        outbid_notifier.forget(auction_id)
                         
                         # 4. Delete all bids for this auction
                         try:
@@ -473,19 +1015,49 @@ async def end_expired_auctions():
 @app.on_event("startup")
 async def startup_background_tasks():
     asyncio.create_task(end_expired_auctions())
+    asyncio.create_task(auction_scheduler.run())
+    asyncio.create_task(outbid_notifier.run())
+    asyncio.create_task(outbid_notifier.run_voice())
 
 # Schedule auction end
-async def schedule_auction_end(auction_id: int, end_time: datetime):
-    """Schedule the end of an auction"""
-    try:
-        # Calculate seconds until auction end
-        time_until_end = (end_time - datetime.now()).total_seconds()
-        if time_until_end > 0:
-            print(f"[Auction Scheduler] Scheduling end for auction {auction_id} in {time_until_end} seconds")
-            await asyncio.sleep(time_until_end)
-            await end_auction(auction_id)
-    except Exception as e:
-        print(f"Error scheduling auction end: {e}")
+class AuctionScheduler:
+    """Ends auctions at their end time using one heap and one sleeping task"""
+
+    def __init__(self):
+        self.deadlines: List[tuple] = []  # heap of (end timestamp, auction_id)
+        self.wakeup = asyncio.Event()
+
+    def schedule(self, auction_id: int, end_time):
+        self.schedule_many([(auction_id, end_time)])
+
+    def schedule_many(self, entries: List[tuple]):
+        """Register (auction_id, end_time) pairs and wake the worker once"""
+        for auction_id, end_time in entries:
+            heapq.heappush(self.deadlines, (parse_timestamp(end_time), auction_id))
+        print(f"[Auction Scheduler] Registered {len(entries)} auction end time(s)")
+        self.wakeup.set()
+
+    async def run(self):
+        while True:
+            self.wakeup.clear()
+            if not self.deadlines:
+                await self.wakeup.wait()
+                continue
+            delay = self.deadlines[0][0] - datetime.now().timestamp()
+            if delay > 0:
+                try:
+                    # Sleep until the earliest deadline, or until an earlier one is registered
+                    await asyncio.wait_for(self.wakeup.wait(), timeout=delay)
+                except asyncio.TimeoutError:
+                    pass
+                continue
+            _, auction_id = heapq.heappop(self.deadlines)
+            try:
+                await end_auction(auction_id)
+            except Exception as e:
+                print(f"[Auction Scheduler] Error ending auction {auction_id}: {e}")
+
+auction_scheduler = AuctionScheduler()
 
 # Improved end auction function
 async def end_auction(auction_id: int):
@@ -535,6 +1107,8 @@ async def end_auction(auction_id: int):
             .update({'status': 'ended'})\
             .eq('id', auction_id)\
             .execute()
+        search_index.remove(auction_id)
+        outbid_notifier.forget(auction_id)
             
         # Broadcast auction end
         try:
@@ -565,18 +1139,18 @@ async def handle_voice_command(command: Dict[str, Any]):
     try:
         transcript = command.get('transcript', '').lower()
         
-        # Command: Place bid (e.g., 'bid 500 on auction 3')
+        # Command: Place bid (e.g., 'bid 500 on auction 3' or 'bid 500 on the rolex')
         if transcript.startswith('bid') or 'bid' in transcript:
-            import re
-            match = re.search(r"bid (\d+(?:\.\d+)?) (?:on )?auction (\d+)", transcript)
-            if match:
+            match = re.search(r"bid ₹?(\d+(?:\.\d+)?) (?:on |for )?(.+)", transcript)
+            auction_id = await extract_auction_id(match.group(2)) if match else None
+            if match and not auction_id:
+                msg = f"I couldn't tell which auction you meant by '{match.group(2)}'. Please say the auction number, for example 'bid 500 on auction 3'."
+                await send_voice_notification(msg)
+                return {"message": msg}
+            if auction_id:
                 amount = float(match.group(1))
-                auction_id = int(match.group(2))
                 # Use a default/system user for Omnidimension bids
-                system_user = {
-                    'id': 'omnidimension-system',
-                    'email': 'omnidimension@system.local'
-                }
+                system_user = VOICE_BIDDER
                 try:
                     # Fetch the auction
                     auction_resp = supabase.table('auctions').select('*').eq('id', auction_id).single().execute()
@@ -589,6 +1163,7 @@ async def handle_voice_command(command: Dict[str, Any]):
                         msg = "Bid too low"
                         await send_voice_notification(msg)
                         return {"message": msg}
+                    previous_leader = get_leading_bid(auction)
                     # Insert the bid
                     supabase.table('bids').insert({
                         'auction_id': auction_id,
@@ -602,6 +1177,8 @@ async def handle_voice_command(command: Dict[str, Any]):
                         'current_bid': amount,
                         'bid_count': auction['bid_count'] + 1
                     }).eq('id', auction_id).execute()
+                    search_index.upsert({**auction, 'current_bid': amount, 'bid_count': auction['bid_count'] + 1})
+                    outbid_notifier.record_bid(auction, system_user['id'], system_user['email'], amount, previous=previous_leader)
                     msg = f"Bid of ₹{amount} placed on auction {auction_id} by Omnidimension."
                     await send_voice_notification(msg)
                     return {"message": msg}
@@ -610,24 +1187,30 @@ async def handle_voice_command(command: Dict[str, Any]):
                     await send_voice_notification(msg)
                     return {"message": msg}
             else:
-                msg = "Could not understand bid command. Please say, for example, 'bid 500 on auction 3'."
+                msg = "Could not understand bid command. Please say, for example, 'bid 500 on auction 3' or 'bid 500 on the Rolex'."
                 await send_voice_notification(msg)
                 return {"message": msg}
         
         # Command: End auction
         if 'end auction' in transcript:
-            auction_id = extract_auction_id(transcript)
+            auction_id = await extract_auction_id(transcript)
             if auction_id:
                 await end_auction(auction_id)
                 return {"message": f"Auction {auction_id} ended successfully"}
+            msg = "I couldn't tell which auction to end. Please say the auction number, for example 'end auction 3'."
+            await send_voice_notification(msg)
+            return {"message": msg}
         
         # Command: Get auction status
         elif 'auction status' in transcript or 'get status' in transcript:
-            auction_id = extract_auction_id(transcript)
+            auction_id = await extract_auction_id(transcript)
             if auction_id:
                 status = await get_auction_status(auction_id)
                 await send_voice_notification(status)
                 return {"message": status}
+            msg = "I couldn't tell which auction you meant. Please say the auction number, for example 'auction status 3'."
+            await send_voice_notification(msg)
+            return {"message": msg}
         
         # Command: List active auctions
         elif 'list auctions' in transcript or 'show auctions' in transcript:
@@ -641,9 +1224,19 @@ async def handle_voice_command(command: Dict[str, Any]):
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
+VOICE_COMMAND_WORDS = {"auction", "bid", "end", "get", "status", "lot", "item", "number"}
+
 async def extract_auction_id(transcript: str) -> Optional[int]:
-    """Extract auction ID from voice command"""
+    """Extract auction ID from voice command, by number or by item name"""
     try:
+        explicit = re.search(r"(?:auction|lot|number) (\d+)\b", transcript)
+        if explicit:
+            return int(explicit.group(1))
+        phrase = " ".join(w for w in transcript.split() if w not in VOICE_COMMAND_WORDS)
+        if re.search(r"[a-z]", phrase):
+            # Resolve names like 'the rolex' against the in-memory search index. Never fall
+            # back to a stray number once a name was given: 'iphone 15' is not auction 15
+            return search_index.resolve(phrase)
         words = transcript.split()
         for i, word in enumerate(words):
             if word.isdigit():
@@ -677,6 +1270,8 @@ async def end_auction(auction_id: int):
         
         # Delete auction
         supabase.table('auctions').delete().eq('id', auction_id).execute()
+        search_index.remove(auction_id)
+        outbid_notifier.forget(auction_id)
         
         # Broadcast to WebSocket
         await manager.broadcast_to_auction(